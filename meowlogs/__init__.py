@@ -2,12 +2,15 @@
 #
 # SPDX-License-Identifier: MIT
 
+from .config import ConfigLogging, lazy_repr
 from .files import Directory, File, LoggingFile
 from .handlers import TimedRotatingFileHandler
 
 __all__ = (
+    "ConfigLogging",
     "Directory",
     "File",
     "LoggingFile",
     "TimedRotatingFileHandler",
+    "lazy_repr",
 )
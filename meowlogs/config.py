@@ -1,104 +1,112 @@
-from collections.abc import MutableMapping
+"""
+Build `logging.config.dictConfig` configurations.
+
+To log a whole configuration, wrap it in `lazy_repr` so the representation
+of all its items is only built when the record is actually emitted::
+
+    logger.debug("cfg=%s", lazy_repr(config))
+"""
+
+from copy import copy
+from types import MappingProxyType
 from typing import Any
 
+_DEFAULT_FORMAT = (
+    "[%(name)s %(levelname)s %(asctime)s %(filename)s: %(lineno)d"
+    " - %(funcName)s()] %(message)s"
+)
+_DEFAULT_FORMATTER = MappingProxyType(
+    {
+        "format": _DEFAULT_FORMAT,
+        "datefmt": "%Y-%m-%d %H:%M:%S",
+    }
+)
+_DEFAULT_DJANGO_FORMATTER = MappingProxyType(
+    {
+        "()": "django.utils.log.ServerFormatter",
+        **_DEFAULT_FORMATTER,
+    }
+)
+
+
+class _LazyRepr:
+    """
+    Defers `repr` of an object until the wrapper is converted to a string.
+
+    Dictionaries, including `ConfigLogging`, are shown with the plain `dict`
+    representation of all their items.
+
+    Attributes:
+        o (Any): The wrapped object.
+    """
+
+    __slots__ = ("o",)
 
-class ConfigLogging(MutableMapping):
+    def __init__(self, o: Any):
+        self.o = o
+
+    def __str__(self) -> str:
+        o = self.o
+        return repr(dict(o) if isinstance(o, dict) else o)
+
+    __repr__ = __str__
+
+
+lazy_repr = _LazyRepr
+
+
+class ConfigLogging(dict):
     """
-    A configuration manager class for logging settings, implementing a mutable mapping.
+    A configuration manager class for logging settings, implemented as a dictionary.
 
     This class allows you to manage logging formatters, handlers, and loggers dynamically
-    through a dictionary-like interface. It defines default logging configurations and
+    through a dictionary interface. It defines default logging configurations and
     provides methods for adding and customizing various logging components.
+    Being a plain dictionary, it is passed to `logging.config.dictConfig` as is.
 
     Attributes:
-        default_config (dict): The default logging configuration containing the version,
-            disable flag for existing loggers, and placeholders for formatters, handlers,
-            and loggers.
+        default_config (MappingProxyType): The read-only default logging configuration
+            containing the version, disable flag for existing loggers, and placeholders
+            for formatters, handlers, and loggers.
 
     Methods:
-        __getitem__(key): Retrieve the value associated with a given key in the configuration.
-        __setitem__(key, value): Set the value for a specific key in the configuration.
-        __delitem__(key): Remove the key-value pair from the configuration.
-        __iter__(): Return an iterator over the configuration keys.
-        __len__(): Return the number of key-value pairs in the configuration.
         add_formatter(name, formatter): Add a logging formatter to the configuration.
         add_default_formatter(): Add a predefined logging formatter to the configuration.
         add_default_django_formatter(): Add a Django-specific logging formatter.
         add_handler(name, handler): Add a logging handler to the configuration.
         add_console_handler(level, class_handler, formatter, stream): Add a console logging handler.
-        add_file_handler(directory, level, class_handler, formatter): Add a file logging handler.
+        add_file_handler(directory, level, class_handler, formatter, name): Add a file logging handler.
         add_logger(name, logger): Add a logger to the configuration.
         add_default_logger(name, handlers, level, propagate): Add a predefined logger with default handlers.
     """
 
-    default_config = {
-        "version": 1,
-        "disable_existing_loggers": True,
-        "formatters": {},
-        "handlers": {},
-        "loggers": {},
-    }
-
-    def __init__(self):
-        self.__dict__.update(self.default_config)
-
-    def __getitem__(self, key: Any):
-        """
-        Retrieve the value associated with a given key in the configuration.
-
-        Args:
-            key (Any): The key for the value to retrieve.
-
-        Returns:
-            Any: The value associated with the given key, or None if the key is not found.
-        """
-        return self.__dict__.get(key, None)
-
-    def __delitem__(self, key: Any):
-        """
-        Doesn't do anything.
-
-        Args:
-            key (Any): The key to be removed from the configuration.
-        """
-
-    def __setitem__(self, key: Any, value: Any):
-        """
-        Set the value for a given key in the configuration.
-
-        Args:
-            key (Any): The key for which to set the value.
-            value (Any): The value to associate with the given key.
-        """
-        if key in self.__dict__:
-            self.__dict__[key] = value
-
-    def __iter__(self):
-        """
-        Return an iterator over the configuration keys.
+    __slots__ = ()
 
-        Returns:
-            Iterator: An iterator over the configuration keys.
-        """
-        return iter(self.__dict__)
-
-    def __len__(self):
-        """
-        Return the number of key-value pairs in the configuration.
+    default_config = MappingProxyType(
+        {
+            "version": 1,
+            "disable_existing_loggers": True,
+            "formatters": {},
+            "handlers": {},
+            "loggers": {},
+        }
+    )
 
-        Returns:
-            int: The number of key-value pairs.
-        """
-        return len(self.__dict__)
+    def __init__(self):
+        super().__init__(
+            (key, copy(value)) for key, value in self.default_config.items()
+        )
 
     def __repr__(self):
         """
-        Return a string representation of the configuration.
+        Return a short representation listing only the top-level keys.
+
+        Use `lazy_repr(config)` or `dict(config)` to see the whole configuration.
 
         Returns:
             str: The string representation of the configuration.
         """
-        return self.__dict__.__repr__()
+        return f"ConfigLogging(keys={list(self)})"
 
     def add_formatter(self, name: str, formatter: dict[str, Any]):
         """
@@ -114,26 +122,13 @@ class ConfigLogging(MutableMapping):
         """
         Add a predefined logging formatter to the configuration.
         """
-        self["formatters"]["formatter"] = {
-            "format": (
-                "[%(name)s %(levelname)s %(asctime)s %(filename)s: %(lineno)d"
-                " - %(funcName)s()] %(message)s"
-            ),
-            "datefmt": "%Y-%m-%d %H:%M:%S",
-        }
+        self["formatters"]["formatter"] = _DEFAULT_FORMATTER.copy()
 
     def add_default_django_formatter(self):
         """
         Add a Django-specific logging formatter to the configuration.
         """
-        self["formatters"]["formatter"] = {
-            "()": "django.utils.log.ServerFormatter",
-            "format": (
-                "[%(name)s %(levelname)s %(asctime)s %(filename)s: %(lineno)d"
-                " - %(funcName)s()] %(message)s"
-            ),
-            "datefmt": "%Y-%m-%d %H:%M:%S",
-        }
+        self["formatters"]["formatter"] = _DEFAULT_DJANGO_FORMATTER.copy()
 
     def add_handler(self, name: str, handler: dict[str, Any]):
         """
@@ -174,6 +169,7 @@ class ConfigLogging(MutableMapping):
         level: str = "INFO",
         class_handler: str = "meowlogs.handlers.TimedRotatingFileHandler",
         formatter: str = "formatter",
+        name: str = "file",
     ):
         """
         Add a file logging handler.
@@ -183,8 +179,9 @@ class ConfigLogging(MutableMapping):
             level (str): Logging level, default is "INFO".
             class_handler (str): Handler class, default is "meowlogs.handlers.TimedRotatingFileHandler".
             formatter (str): Formatter name, default is "formatter".
+            name (str): The name of the handler, default is "file".
         """
-        self["handlers"]["file"] = {
+        self["handlers"][name] = {
             "level": level,
             "class": class_handler,
             "formatter": formatter,
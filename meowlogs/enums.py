@@ -1,5 +1,5 @@
 import logging
-from enum import IntEnum
+from enum import Enum, IntEnum
 
 
 class LoggingLevel(IntEnum):
@@ -11,3 +11,8 @@ class LoggingLevel(IntEnum):
     INFO = logging.INFO
     DEBUG = logging.DEBUG
     NOTSET = logging.NOTSET
+
+
+class WriteMode(str, Enum):
+    DIRECT = "direct"
+    ASYNC = "async"
@@ -1,8 +1,80 @@
 import os
-from dataclasses import dataclass
+import re
+import stat
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, List, Optional, Tuple
+
+_SUFFIX_FIELDS = {
+    "Y": "year",
+    "m": "month",
+    "d": "day",
+    "H": "hour",
+    "M": "minute",
+    "S": "second",
+}
+_DEFAULT_DATE = {"year": 1900, "month": 1, "day": 1}
+
+_SuffixPattern = Tuple["re.Pattern[str]", Tuple[str, ...]]
+
+
+def _compile_suffix(suffix: str) -> Optional[_SuffixPattern]:
+    """
+    Converts a datetime suffix into a regular expression with one group per field.
+
+    Only zero-padded `%Y`, `%m`, `%d`, `%H`, `%M` and `%S` codes and literal
+    characters are supported.
+
+    Args:
+        suffix (str): The datetime format suffix used in file names.
+
+    Returns:
+        _SuffixPattern | None: The compiled pattern and the datetime field of
+        each group, or None if the suffix uses any other format code.
+    """
+    parts: List[str] = []
+    fields: List[str] = []
+    i = 0
+    while i < len(suffix):
+        char = suffix[i]
+        if char != "%":
+            parts.append(re.escape(char))
+            i += 1
+            continue
+        code = suffix[i + 1 : i + 2]
+        if code == "%":
+            parts.append("%")
+        elif code in _SUFFIX_FIELDS and _SUFFIX_FIELDS[code] not in fields:
+            parts.append(r"(\d{4})" if code == "Y" else r"(\d{2})")
+            fields.append(_SUFFIX_FIELDS[code])
+        else:
+            return None
+        i += 2
+    return re.compile("".join(parts)), tuple(fields)
+
+
+@lru_cache(maxsize=1024)
+def _strptime(name: str, suffix: str) -> Optional[datetime]:
+    """
+    Parses a file name with `datetime.strptime`, caching the result.
+
+    The same rotated file names are parsed again at every rollover, so
+    names the compiled pattern cannot handle are only parsed once.
+
+    Args:
+        name (str): The file name to parse.
+        suffix (str): The datetime format suffix used in file names.
+
+    Returns:
+        datetime | None: The parsed datetime, or None if the name does not
+        match the suffix.
+    """
+    try:
+        return datetime.strptime(name, suffix)
+    except ValueError:
+        return None
 
 
 @dataclass(repr=False, eq=False, frozen=True, slots=True, match_args=False)
@@ -83,6 +155,9 @@ class File(Directory):
         """
         Retrieves a list of file names in the directory.
 
+        Subdirectories are skipped; `os.scandir` provides the entry type
+        without an extra `stat` call per entry.
+
         Returns:
             list[str]: A list of file names if the directory exists,
             otherwise None.
@@ -91,7 +166,8 @@ class File(Directory):
             FileNotFoundError: If the directory does not exist.
         """
         try:
-            return os.listdir(self.directory)
+            with os.scandir(self.directory) as entries:
+                return [entry.name for entry in entries if entry.is_file()]
         except OSError:
             pass
 
@@ -106,10 +182,13 @@ class File(Directory):
         Returns:
             bool: True if the file exists and is a file, otherwise False.
         """
-        return all((os.path.exists(filename), os.path.isfile(filename)))
+        try:
+            return stat.S_ISREG(os.stat(filename).st_mode)
+        except OSError:
+            return False
 
 
-@dataclass(repr=False, eq=False, frozen=True, slots=True, match_args=False)
+@dataclass(init=False, repr=False, eq=False, frozen=True, slots=True, match_args=False)
 class LoggingFile(File):
     """
     A class for handling logging operations with files in a specific directory.
@@ -123,6 +202,8 @@ class LoggingFile(File):
         backup_count (int): The maximum number of backup files to retain.
 
     Methods:
+        parse_date(name: str) -> datetime | None:
+            Parses the datetime suffix of a file name.
         filename_datetime(file_names: List[str]) -> List[str]:
             Extracts datetime-suffixed file names and sorts them in chronological order.
         file_to_delete() -> None:
@@ -131,39 +212,76 @@ class LoggingFile(File):
 
     suffix: str
     backup_count: int
+    _pattern: Optional[_SuffixPattern] = field(init=False)
+
+    def __init__(self, directory: str, suffix: str, backup_count: int):
+        _set = object.__setattr__
+        _set(self, "directory", directory)
+        _set(self, "suffix", suffix)
+        _set(self, "backup_count", backup_count)
+        _set(self, "_pattern", _compile_suffix(suffix))
+
+    def parse_date(self, name: str) -> datetime | None:
+        """
+        Parses the datetime suffix of a file name.
+
+        Names are matched against the suffix compiled once per instance;
+        `datetime.strptime` is only used, with its results cached, for
+        suffixes the pattern cannot express and for names that do not
+        match it.
+
+        Args:
+            name (str): The file name to parse.
+
+        Returns:
+            datetime | None: The parsed datetime, or None if the name does
+            not match the suffix.
+        """
+        if self._pattern is not None:
+            pattern, fields = self._pattern
+            match = pattern.fullmatch(name)
+            if match is not None:
+                values: Dict[str, Any] = dict(_DEFAULT_DATE)
+                values.update(zip(fields, map(int, match.groups())))
+                try:
+                    return datetime(**values)
+                except ValueError:
+                    return None
+        return _strptime(name, self.suffix)
 
     def filename_datetime(self, file_names: List[str]) -> List[str]:
         """
         Extracts and sorts file names based on their datetime suffix.
 
+        Files whose names do not match the datetime suffix format are
+        deleted. The returned names are the given ones, ordered by their
+        parsed dates, so no name is formatted back from a datetime.
+
         Args:
             file_names (List[str]): A list of file names to process.
 
         Returns:
             List[str]: A list of file names with valid datetime suffixes,
             sorted in chronological order.
-
-        Raises:
-            ValueError: If a file name does not match the datetime suffix format,
-            the file is deleted.
         """
-        dates: List[datetime] = []
+        dated: List[Tuple[datetime, str]] = []
         for file in file_names:
-            try:
-                date = datetime.strptime(file, self.suffix)
-                dates.append(date)
-            except ValueError:
+            date = self.parse_date(file)
+            if date is None:
                 self.delete_file(file)
-        dates.sort()
-        return [datetime.strftime(value, self.suffix) for value in dates]
+            else:
+                dated.append((date, file))
+        dated.sort()
+        return [file for _, file in dated]
 
     def file_to_delete(self) -> None:
         """
         Deletes files exceeding the specified backup count.
 
-        This method retrieves file names from the directory, sorts them
-        by their datetime suffix, and deletes the oldest files if the
-        number of files exceeds the `backup_count` attribute.
+        This method scans the directory once, sorts the file names by their
+        datetime suffix with `filename_datetime`, which also deletes files
+        whose names do not match the suffix, and deletes the oldest files if
+        the number of files exceeds the `backup_count` attribute.
 
         Returns:
             None
@@ -1,10 +1,156 @@
-import fcntl
+import atexit
 import logging
 import os
-from datetime import datetime
+import queue
+import re
+import threading
+import time
+import traceback
+import warnings
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta
+from functools import cached_property
+from typing import Callable, List, TextIO, Tuple
 
-from meowlogs.enums import LoggingLevel
-from meowlogs.files import LoggingFile
+from meowlogs.enums import LoggingLevel, WriteMode
+from meowlogs.files import Directory, LoggingFile
+
+try:
+    from fcntl import LOCK_EX, LOCK_UN
+    from fcntl import flock as _flock
+except ImportError:  # fcntl is not available on Windows
+    LOCK_EX = LOCK_UN = 0  # type: ignore[misc]
+
+    def _flock(fd, operation):  # type: ignore[misc]
+        """Does nothing where file locks are not available."""
+
+
+_STOP = object()
+# time.strftime leaves "%f" as is, so such a suffix never rotates per record
+_SUB_SECOND_CODE = re.compile(r"(?<!%)(?:%%)*%f")
+# Format codes of the finest unit first, with the start of the current unit
+_ROLLOVER_UNITS: Tuple[
+    Tuple["re.Pattern[str]", Callable[[datetime], datetime], timedelta], ...
+] = (
+    (
+        re.compile(r"%[SsXcTr]"),
+        lambda now: now.replace(microsecond=0),
+        timedelta(seconds=1),
+    ),
+    (
+        re.compile(r"%[MR]"),
+        lambda now: now.replace(second=0, microsecond=0),
+        timedelta(minutes=1),
+    ),
+    (
+        re.compile(r"%[HIklp]"),
+        lambda now: now.replace(minute=0, second=0, microsecond=0),
+        timedelta(hours=1),
+    ),
+)
+
+
+def _start_of_day(now: datetime) -> datetime:
+    return now.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+_LEVEL_MAP = {name: member.value for name, member in LoggingLevel.__members__.items()}
+
+
+class _WriterThread(threading.Thread):
+    """
+    A background thread that writes queued log lines to the handler's log file.
+
+    The thread owns the handler's stream while it runs: it drains up to
+    `message_capa` lines at a time, writes them in one batch and flushes the
+    stream when the handler's flush interval has elapsed or the queue is idle.
+    Lines are queued with their terminator, and a batch is joined into a
+    single string so the text layer encodes and buffers it only once.
+
+    Attributes:
+        queue (Queue): The queue of formatted log lines and control markers.
+    """
+
+    def __init__(
+        self,
+        handler: "TimedRotatingFileHandler",
+        pool_capa: int,
+        message_capa: int,
+    ):
+        super().__init__(name="meowlogs-writer", daemon=True)
+        self._handler = handler
+        self._message_capa: int = message_capa
+        self.queue: queue.Queue = queue.Queue(maxsize=pool_capa)
+
+    def run(self):
+        """
+        Drains the queue until the stop marker is received.
+        """
+        handler = self._handler
+        # Without an interval every batch is flushed, so there is nothing
+        # to flush while idle and the thread blocks instead of spinning
+        timeout = handler._flush_interval or None
+        while True:
+            try:
+                items = [self.queue.get(timeout=timeout)]
+            except queue.Empty:
+                handler.flush_stream()
+                continue
+            while len(items) < self._message_capa:
+                try:
+                    items.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            if self.write_batch(items):
+                return
+
+    def write_batch(self, items: List) -> bool:
+        """
+        Writes a batch of queued items, honouring flush and stop markers.
+
+        A flush marker is a `threading.Event`. It is set once the lines
+        queued before it have been written and flushed, or once the batch
+        has failed, so a waiting `flush` never waits for later lines.
+
+        Args:
+            items (List): Formatted log lines mixed with control markers.
+
+        Returns:
+            bool: True if the stop marker was part of the batch.
+        """
+        handler = self._handler
+        lines: List[str] = []
+        try:
+            for item in items:
+                if isinstance(item, threading.Event) or item is _STOP:
+                    if lines:
+                        handler.write_lines(lines)
+                        lines = []
+                    handler.flush_stream()
+                    if isinstance(item, threading.Event):
+                        item.set()
+                    else:
+                        return True
+                else:
+                    lines.append(item)
+            if lines:
+                handler.write_lines(lines)
+        except Exception:  # noqa: BLE001
+            # The writer thread must outlive a failed batch
+            for item in items:
+                if isinstance(item, threading.Event):
+                    item.set()
+            if logging.raiseExceptions:
+                traceback.print_exc()
+            return any(item is _STOP for item in items)
+        return False
+
+    def stop(self):
+        """
+        Writes all queued lines, then stops the thread and waits for it.
+        """
+        self.queue.put(_STOP)
+        self.join()
 
 
 class TimedRotatingFileHandler(logging.FileHandler):
@@ -12,27 +158,79 @@ class TimedRotatingFileHandler(logging.FileHandler):
     A logging handler for managing log files that rotate based on date.
 
     This handler writes log records to a file, rotating the log file
-    based on the specified date suffix. It ensures proper file locking
-    during writes, supports log file rollovers, and removes old log
-    files based on the backup count.
+    based on the specified date suffix. Records are written to a buffered
+    stream that is flushed periodically instead of after every record;
+    file locking, where `fcntl` is available, can be enabled for several
+    processes sharing one file.
+    In the "async" write mode records are only formatted and queued by the
+    calling thread, and a background thread writes them to the file.
+    It supports log file rollovers and removes old log files based on
+    the backup count.
 
     Attributes:
         _directory (str): The directory where log files will be created.
+        _prefix (str): The absolute directory path followed by the path separator.
         _suffix (str): The date format suffix for log file rotation.
         _backup_count (int): The number of backup log files to retain.
-        _handler (LoggingFile): A helper for handling file operations.
+        _handler (LoggingFile): A helper for handling file operations, created on first use.
+        _cached_time (int): The second for which `_cached_name` was computed.
+        _cached_name (str): The log file name computed by the last `get_filename` call.
         _filename (str): The current log file's name.
-        _level (int): The log level threshold for this logger.
+        _level (int): The log level from the `level` argument, also set as the handler level.
+        _buffer_capacity (int): The size of the write buffer in bytes.
+        _flush_interval (float): The maximum number of seconds between flushes.
+        _use_flock (bool): Whether every write is locked and flushed at once.
+        _last_flush (float): The monotonic time of the last flush.
+        _next_rollover (float): The timestamp until which the log file name stays the same.
+        _needs_cleanup (bool): Whether old log files have to be removed after a rollover.
+        _writer (_WriterThread | None): The background writer in "async" write mode.
+        _cleanup_executor (ThreadPoolExecutor | None): The thread removing old log files, started on the first rollover.
+        _fast_formatter (Formatter | None): The formatter whose `format` may be inlined.
+        _uses_time (bool): Whether the fast formatter needs `asctime`.
 
     Methods:
         init_file(): Ensures log directory existence and initializes the log file.
+        validate_suffix(suffix): Falls back to "%Y-%m-%d" with a warning for an invalid suffix.
         get_filename(): Constructs the log file name based on date and suffix.
         do_rollover(filename): Rolls over to a new log file.
+        check_rollover(): Rolls over to a new log file if the date has changed.
+        remove_old_files(): Removes old log files after a rollover.
+        get_next_rollover(): Computes the time at which the log file name can change.
         get_level_logging(level): Maps log level names to numeric log levels.
+        setFormatter(fmt): Sets the formatter and precomputes its fast path.
+        format(record): Formats a log record, skipping unused formatter steps.
         write_record_to_file(record): Writes a formatted log record to the log file.
+        write_lines(lines): Writes already formatted log lines to the log file.
+        open_stream(): Returns the log file stream, opening it if `delay` was set.
+        flush_stream(): Flushes the stream of the log file.
+        flush(): Flushes the buffered log records to the log file.
+        close(): Stops the background threads and closes the log file.
+        handle(record): Filters a log record and emits it under the handler lock.
         emit(record): Writes a log record with log rotation if necessary.
+        handle_batch(records): Writes several log records with a single write.
     """
 
+    __slots__ = (
+        "_backup_count",
+        "_buffer_capacity",
+        "_cached_name",
+        "_cached_time",
+        "_cleanup_executor",
+        "_directory",
+        "_fast_formatter",
+        "_filename",
+        "_flush_interval",
+        "_last_flush",
+        "_level",
+        "_needs_cleanup",
+        "_next_rollover",
+        "_prefix",
+        "_suffix",
+        "_use_flock",
+        "_uses_time",
+        "_writer",
+    )
+
     def __init__(
         self,
         directory: str,
@@ -43,63 +241,241 @@ class TimedRotatingFileHandler(logging.FileHandler):
         delay: bool = False,
         errors: str | None = None,
         level: str = "INFO",
+        buffer_capacity: int = 65536,
+        flush_interval: float = 1.0,
+        use_flock: bool = False,
+        write_mode: str = WriteMode.DIRECT,
+        pool_capa: int = 10000,
+        message_capa: int = 512,
     ):
         self._directory: str = directory
-        self._suffix: str = suffix
+        self._prefix: str = os.path.abspath(os.fspath(directory)) + os.sep
+        self._suffix: str = self.validate_suffix(suffix)
         self._backup_count: int = backup_count
-        self._handler: LoggingFile = LoggingFile(
-            self._directory,
-            self._suffix,
-            self._backup_count,
-        )
-        self._filename: str = self.init_file()
+        self._cached_time: int = -1
+        self._cached_name: str = ""
+        now = time.time()
+        self._filename: str = self.init_file(now)
         self._level: int = self.get_level_logging(level)
+        self._buffer_capacity: int = buffer_capacity
+        self._flush_interval: float = flush_interval
+        self._use_flock: bool = use_flock
+        self._last_flush: float = time.monotonic()
+        self._next_rollover: float = self.get_next_rollover(now)
+        self._needs_cleanup: bool = False
+        self._writer: _WriterThread | None = None
+        self._cleanup_executor: ThreadPoolExecutor | None = None
+        self._fast_formatter: logging.Formatter | None = None
+        self._uses_time: bool = False
         super().__init__(self._filename, mode, encoding, delay, errors)
+        self.setLevel(self._level)
+        if write_mode == WriteMode.ASYNC:
+            self._writer = _WriterThread(self, pool_capa, message_capa)
+            self._writer.start()
+        atexit.register(self.flush)
 
-    def init_file(self) -> str:
+    def _open(self):
+        """
+        Opens the current log file with a write buffer of `buffer_capacity` bytes.
+
+        The file descriptor is always opened with `O_APPEND`, so every write
+        goes to the end of the file even when several processes write to it.
+        The buffered stream does not write whole records, though, so records
+        from several processes can be split mid-line unless `use_flock` is
+        enabled, which writes and flushes every record under a file lock.
+
+        Returns:
+            TextIO: The opened log file stream.
+        """
+        flags = os.O_WRONLY | os.O_CREAT | os.O_APPEND
+        if "w" in self.mode:
+            flags |= os.O_TRUNC
+        fd = os.open(self.baseFilename, flags, 0o666)
+        return os.fdopen(
+            fd,
+            "a",
+            buffering=self._buffer_capacity,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+
+    @cached_property
+    def _handler(self) -> LoggingFile:
+        """
+        Creates the helper for log file operations on first use.
+
+        Only a rollover needs it, so a handler that never rolls over never
+        creates one. Old files are removed after the new log file has been
+        created, so the new file is counted in addition to the backups.
+
+        Returns:
+            LoggingFile: The helper for the log directory.
+        """
+        return LoggingFile(self._directory, self._suffix, self._backup_count + 1)
+
+    @staticmethod
+    def validate_suffix(suffix: str) -> str:
+        """
+        Checks once that the suffix can be used to format a date.
+
+        An unusable suffix is replaced by "%Y-%m-%d" with a warning, so the
+        handler keeps working but the changed file names are reported.
+
+        Args:
+            suffix (str): The date format suffix for log file rotation.
+
+        Returns:
+            str: The suffix, or "%Y-%m-%d" if it cannot format a date or
+            contains "%f".
+        """
+        if _SUB_SECOND_CODE.search(suffix):
+            reason = "%f is not supported by time.strftime"
+        else:
+            try:
+                time.strftime(suffix, time.localtime())
+            except ValueError as exc:
+                reason = str(exc)
+            else:
+                return suffix
+        warnings.warn(
+            f"Invalid log file suffix {suffix!r} ({reason}), using '%Y-%m-%d'",
+            stacklevel=3,
+        )
+        return "%Y-%m-%d"
+
+    def init_file(self, now: float | None = None) -> str:
         """
         Ensures that the log directory exists and initializes the current log file.
 
+        Args:
+            now (float | None): The timestamp to name the file for, or None
+                for the current time.
+
         Returns:
             str: The name of the initialized log file.
         """
-        self._handler.directory_exist()
-        return self.get_filename()
+        Directory(self._directory).directory_exist()
+        return self.get_filename(now)
 
-    def get_filename(self) -> str:
+    def get_filename(self, now: float | None = None) -> str:
         """
         Constructs the log file name based on the current date and suffix.
 
         This method generates a file name by formatting the current date using the
-        specified suffix and appending it to the directory path.
+        specified suffix and appending it to the absolute directory path. The
+        suffix is validated in `__init__`, so no error handling is needed here.
+        The name is formatted at most once per second and reused otherwise.
+
+        Args:
+            now (float | None): The timestamp to name the file for, or None
+                for the current time.
 
         Returns:
             str: The constructed log file name.
         """
-        try:
-            current_date = datetime.now().strftime(self._suffix)
-        except ValueError:
-            current_date = datetime.now().strftime("%Y-%m-%d")
-        filename = str(self._directory) + "/" + str(current_date)
-        return filename
+        second = int(time.time() if now is None else now)
+        if second != self._cached_time:
+            self._cached_name = self._prefix + time.strftime(
+                self._suffix, time.localtime(second)
+            )
+            self._cached_time = second
+        return self._cached_name
 
     def do_rollover(self, filename: str):
         """
         Handles log file rollover to a new file.
 
-        This method closes the current log file, updates the handler
-        to use a new file specified by `filename`, and ensures that
-        the new file is open for writing.
+        This method opens the new file specified by `filename` first,
+        then swaps it in as the handler's stream and only afterwards
+        closes the previous log file, so the stream is never left unset
+        while the old file is being flushed. Names from `get_filename`
+        are already absolute and are used as is.
 
         Args:
             filename (str): The path to the new log file.
         """
-        self.close()
         filename = os.fspath(filename)
-        self.baseFilename = os.path.abspath(filename)
+        if not os.path.isabs(filename):
+            filename = os.path.abspath(filename)
+        old_stream = self.stream
+        self.baseFilename = filename
         self.stream = self._open()
+        if old_stream:
+            old_stream.close()
+
+    def check_rollover(self):
+        """
+        Rolls over to a new log file if the expected filename has changed.
+
+        Old log files are removed once per rollover, after the new file
+        is opened. The filename and the next rollover time are computed
+        from the same clock reading, so a rollover is never skipped.
+        """
+        now = time.time()
+        filename = self.get_filename(now)
+        if self._filename != filename:
+            self._filename = filename
+            self._needs_cleanup = True
+            self.do_rollover(filename)
+            self.remove_old_files()
+        self._next_rollover = self.get_next_rollover(now)
+
+    def remove_old_files(self):
+        """
+        Removes log files exceeding the backup count if a rollover requested it.
+
+        The directory is scanned on a background thread, created on the
+        first rollover, so the record that caused the rollover is written
+        without waiting for the old files to be removed.
+        """
+        if self._needs_cleanup:
+            self._needs_cleanup = False
+            executor = self._cleanup_executor
+            if executor is None:
+                executor = self._cleanup_executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="meowlogs-cleanup"
+                )
+            future = executor.submit(self._handler.file_to_delete)
+            future.add_done_callback(self._report_cleanup_error)
 
-    def get_level_logging(self, level: str) -> int:
+    @staticmethod
+    def _report_cleanup_error(future: "Future[None]"):
+        """
+        Prints the traceback of a failed cleanup if `logging.raiseExceptions`.
+
+        Args:
+            future (Future): The finished cleanup task.
+        """
+        exc = future.exception()
+        if exc is not None and logging.raiseExceptions:
+            traceback.print_exception(type(exc), exc, exc.__traceback__)
+
+    def get_next_rollover(self, now: float | None = None) -> float:
+        """
+        Computes the time at which the log file name can change next.
+
+        The name can only change when the finest unit formatted by the
+        suffix does: at the next second, minute or hour for a suffix with
+        such format codes, and at midnight otherwise. The filename does not
+        have to be recomputed before then.
+
+        Args:
+            now (float | None): The timestamp the current filename was
+                computed for, or None for the current time.
+
+        Returns:
+            float: The timestamp of the next change.
+        """
+        current = datetime.fromtimestamp(time.time() if now is None else now)
+        for codes, start_of_unit, step in _ROLLOVER_UNITS:
+            if codes.search(self._suffix):
+                break
+        else:
+            start_of_unit, step = _start_of_day, timedelta(days=1)
+        return (start_of_unit(current) + step).timestamp()
+
+    @staticmethod
+    def get_level_logging(level: str) -> int:
         """
         Converts a log level from its string representation to its numeric value.
 
@@ -109,47 +485,286 @@ class TimedRotatingFileHandler(logging.FileHandler):
         Returns:
             int: The numeric value associated with the specified log level. Defaults to logging.INFO if the level name is not found.
         """
-        if level in LoggingLevel.__members__.keys():
-            return LoggingLevel[level].value
-        return logging.INFO
+        return _LEVEL_MAP.get(level, logging.INFO)
+
+    def setFormatter(self, fmt: logging.Formatter | None):
+        """
+        Sets the formatter and precomputes whether its `format` can be inlined.
+
+        Only formatters that do not override `logging.Formatter.format`
+        use the fast path, so custom formatters keep their behavior.
+
+        Args:
+            fmt (Formatter | None): The formatter for this handler.
+        """
+        super().setFormatter(fmt)
+        if fmt is not None and type(fmt).format is logging.Formatter.format:
+            self._fast_formatter = fmt
+            self._uses_time = fmt.usesTime()
+        else:
+            self._fast_formatter = None
+
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Formats a log record.
+
+        For a record without exception or stack information this does the
+        same as `logging.Formatter.format`, but skips the exception and
+        stack checks and reuses the precomputed `usesTime` result. Without
+        a formatter such a record is formatted as its message, the output
+        of the default "%(message)s" formatter.
+
+        Args:
+            record (LogRecord): The log record to be formatted.
+
+        Returns:
+            str: The formatted log record.
+        """
+        if record.exc_info or record.exc_text or record.stack_info:
+            return super().format(record)
+        formatter = self._fast_formatter
+        if formatter is None or formatter is not self.formatter:
+            if self.formatter is None:
+                record.message = record.getMessage()
+                return record.message
+            return super().format(record)
+        record.message = record.getMessage()
+        if self._uses_time:
+            record.asctime = formatter.formatTime(record, formatter.datefmt)
+        return formatter.formatMessage(record)
 
     def write_record_to_file(self, record: logging.LogRecord):
         """
-        Writes a formatted log record to the current log file, ensuring proper file locking.
+        Writes a formatted log record to the buffered log file stream.
+
+        The stream is flushed once `flush_interval` seconds have passed since
+        the previous flush; a full buffer is written out by the stream itself.
+        With `use_flock` enabled, every record is written and flushed while
+        holding an exclusive file lock.
 
         Args:
             record (LogRecord): The log record to be written to the file.
         """
-        msg = self.format(record)
+        line = self.format(record) + self.terminator
+        stream = self.open_stream()
+        if self._use_flock:
+            try:
+                _flock(stream, LOCK_EX)
+                stream.write(line)
+                self.flush()
+            finally:
+                _flock(stream, LOCK_UN)
+            return
+        stream.write(line)
+        if time.monotonic() - self._last_flush >= self._flush_interval:
+            self.flush()
+
+    def write_lines(self, lines: List[str]):
+        """
+        Writes already formatted log lines to the log file in one call.
+
+        This is used by the background writer and `handle_batch`, which
+        also roll the log file over here when the date has changed. The
+        rollover check runs first, so with `use_flock` enabled the lines
+        are written to the current log file while holding an exclusive
+        lock on it and flushed at once.
+
+        Args:
+            lines (List[str]): Log lines ending with the terminator.
+        """
+        if time.time() >= self._next_rollover:
+            self.check_rollover()
+        stream = self.open_stream()
+        if self._use_flock:
+            try:
+                _flock(stream, LOCK_EX)
+                stream.write("".join(lines))
+                self.flush_stream()
+            finally:
+                _flock(stream, LOCK_UN)
+            return
+        stream.write("".join(lines))
+        if time.monotonic() - self._last_flush >= self._flush_interval:
+            self.flush_stream()
+
+    def open_stream(self) -> TextIO:
+        """
+        Returns the log file stream, opening it first if `delay` was set.
+
+        Returns:
+            TextIO: The stream records are written to.
+        """
+        stream = self.stream
+        if stream is None:
+            stream = self.stream = self._open()
+        return stream
+
+    def flush_stream(self):
+        """
+        Flushes the stream and remembers the time of the flush.
+
+        The handler lock is not taken here, so the background writer never
+        waits for a caller that is blocked on a full queue.
+        """
         stream = self.stream
+        if stream and hasattr(stream, "flush"):
+            stream.flush()
+        self._last_flush = time.monotonic()
+
+    def flush(self):
+        """
+        Flushes the buffered log records to the log file.
+
+        In "async" write mode this waits until the background writer has
+        written and flushed every record queued before this call; records
+        queued afterwards by other threads are not waited for. The flush
+        marker is queued under the handler lock, so it cannot follow the
+        stop marker queued by `close`.
+        """
+        self.acquire()
         try:
-            fcntl.flock(stream, fcntl.LOCK_EX)
-            stream.write(msg + self.terminator)
+            writer = self._writer
+            if writer is None:
+                self.flush_stream()
+                return
+            flushed = threading.Event()
+            writer.queue.put(flushed)
         finally:
-            fcntl.flock(stream, fcntl.LOCK_UN)
-        self.flush()
+            self.release()
+        while not flushed.wait(self._flush_interval or None):
+            if not writer.is_alive():
+                return
+
+    def close(self):
+        """
+        Stops the background threads, if any, and closes the log file.
+
+        The writer is detached and stopped under the handler lock, so no
+        record can be queued after its stop marker and be lost.
+        """
+        atexit.unregister(self.flush)
+        self.acquire()
+        try:
+            writer = self._writer
+            self._writer = None
+            if writer is not None and writer.is_alive():
+                writer.stop()
+        finally:
+            self.release()
+        executor = self._cleanup_executor
+        if executor is not None:
+            self._cleanup_executor = None
+            executor.shutdown(wait=True)
+        super().close()
+
+    def handle(self, record: logging.LogRecord):
+        """
+        Filters a log record and emits it while holding the handler lock.
+
+        The filter step is skipped when no filters are installed, and a
+        LogRecord returned by a filter replaces the record, as in
+        `Handler.handle` on Python 3.12.
+
+        Args:
+            record (LogRecord): The log record to be handled.
+
+        Returns:
+            bool | LogRecord: The result of the filters, as in `Handler.handle`.
+        """
+        rv = self.filter(record) if self.filters else True
+        if rv:
+            if isinstance(rv, logging.LogRecord):
+                record = rv
+            self.acquire()
+            try:
+                self.emit(record)
+            finally:
+                self.release()
+        return rv
 
     def emit(self, record: logging.LogRecord):
         """
         Emit a log record and handle log file rotation if necessary.
 
         This method writes a log record to a file, checking if a log
-        file rotation is required. If the current log file's name
-        differs from the expected filename (based on the date suffix),
-        it performs a rollover. The log record is only written
-        if its log level meets or exceeds the handler's threshold.
+        file rotation is required once the next rollover time has been
+        reached. If the current log file's name differs from the
+        expected filename (based on the date suffix), it performs a
+        rollover. The log record is only written
+        if its log level meets or exceeds the handler's level, which is
+        set from the `level` argument and can be changed with `setLevel`.
+        In "async" write mode the formatted record is queued for the
+        background writer instead.
 
         Args:
             record (LogRecord): The log record to be emitted.
         """
         try:
-            if record.levelno >= self._level:
-                filename = self.get_filename()
-                if not self._handler.file_exist(filename):
-                    self._handler.file_to_delete()
-                if self._filename != filename:
-                    self._filename = filename
-                    self.do_rollover(filename)
+            if record.levelno >= self.level:
+                writer = self._writer
+                if writer is not None:
+                    writer.queue.put(self.format(record) + self.terminator)
+                    return
+                if time.time() >= self._next_rollover:
+                    self.check_rollover()
                 self.write_record_to_file(record)
-        except Exception:
+        except Exception:  # noqa: BLE001
+            # Reported by handleError, as in Handler.emit
             self.handleError(record)
+
+    def handle_batch(self, records: List[logging.LogRecord]):
+        """
+        Handles several log records, writing them to the log file at once.
+
+        Records are checked against the handler level and filters as in
+        `handle`, including a replacement record returned by a filter, then
+        formatted under the handler lock and written as one string with a
+        single rollover check for the whole batch. The rollover check runs
+        before the file lock is taken, so with `use_flock` enabled the batch
+        is written to the current log file while holding an exclusive lock
+        on it and flushed at once. If the batch cannot be written, its
+        records are emitted one by one, so only the failing records are
+        reported. In "async" write mode the formatted records are queued for
+        the background writer instead.
+
+        Args:
+            records (List[LogRecord]): The log records to be written.
+        """
+        accepted: List[logging.LogRecord] = []
+        for record in records:
+            if record.levelno < self.level:
+                continue
+            rv = self.filter(record) if self.filters else True
+            if not rv:
+                continue
+            accepted.append(rv if isinstance(rv, logging.LogRecord) else record)
+        if not accepted:
+            return
+        self.acquire()
+        try:
+            lines: List[str] = []
+            formatted: List[logging.LogRecord] = []
+            for record in accepted:
+                try:
+                    lines.append(self.format(record) + self.terminator)
+                except Exception:  # noqa: BLE001
+                    # Reported by handleError, as in Handler.emit
+                    self.handleError(record)
+                else:
+                    formatted.append(record)
+            if not lines:
+                return
+            writer = self._writer
+            if writer is not None:
+                for line in lines:
+                    writer.queue.put(line)
+                return
+            try:
+                self.write_lines(lines)
+            except Exception:  # noqa: BLE001
+                # Write the records one by one, so that the failing record
+                # is the one reported and the others are not lost
+                for record in formatted:
+                    self.emit(record)
+        finally:
+            self.release()
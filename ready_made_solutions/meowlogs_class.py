@@ -1,32 +1,82 @@
+"""
+Configure a logger once with the `CatLogger` class and use it.
+
+Pass values to the logger as arguments instead of formatting the message
+yourself::
+
+    logger.info("My cat's name is %s!", cat_name)
+
+The message is only formatted if the record is actually emitted, so
+suppressed records cost nothing. Guard expensive arguments with
+`logging.Logger.isEnabledFor`::
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Cats: %s", expensive_report())
+"""
+
 import logging.config
 import os
+import threading
+from typing import ClassVar, Dict, Tuple
 
-from meowlogs.config import ConfigLogging
+from meowlogs import ConfigLogging
 
 LOG_DIR = os.path.join(os.path.dirname(__file__), "cat")
 
 
+def _is_active(logger: logging.Logger) -> bool:
+    # Another dictConfig call disables the logger and closes its file handlers
+    return not logger.disabled and all(
+        getattr(handler, "stream", True) is not None for handler in logger.handlers
+    )
+
+
 class CatLogger:
+    _cache: ClassVar[Dict[Tuple[str, str], logging.Logger]] = {}
+    _lock: ClassVar[threading.Lock] = threading.Lock()
 
     def __init__(self, name_logger: str = "cat", directory: str = LOG_DIR):
         self.name_logger: str = name_logger
         self.directory: str = directory
 
     def __call__(self, *args, **kwargs):
-        config = ConfigLogging()
-        config.add_default_formatter()
-        config.add_console_handler()
-        config.add_file_handler(self.directory)
-        config.add_default_logger(self.name_logger)
-        logging.config.dictConfig(config)
-        return logging.getLogger(self.name_logger)
+        key = (self.name_logger, self.directory)
+        cached = self._cache.get(key)
+        if cached is not None and _is_active(cached):
+            return cached
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None and _is_active(cached):
+                return cached
+            # dictConfig replaces every handler and disables loggers missing
+            # from the config, so the config covers all cached loggers.
+            # A later directory for the same logger name replaces the earlier.
+            loggers: Dict[str, str] = dict([*self._cache, key])
+            for cached_key in list(self._cache):
+                if loggers[cached_key[0]] != cached_key[1]:
+                    del self._cache[cached_key]
+            config = ConfigLogging()
+            config.add_default_formatter()
+            config.add_console_handler()
+            file_handlers: Dict[str, str] = {}
+            for name, directory in loggers.items():
+                if directory not in file_handlers:
+                    file_handlers[directory] = f"file_{len(file_handlers)}"
+                    config.add_file_handler(directory, name=file_handlers[directory])
+                config.add_default_logger(
+                    name, handlers=(file_handlers[directory], "console")
+                )
+            logging.config.dictConfig(config)
+            logger = logging.getLogger(self.name_logger)
+            self._cache[key] = logger
+            return logger
 
 
 def cat(name_logger: str = "cat", directory: str = LOG_DIR):
     logger = CatLogger(name_logger=name_logger, directory=directory)()
-    logger.info("I love cats!")
-    logger.info("My cat's name is Mia!")
-    logger.info("Who do you like more, a cat or a dog?")
+    logger.info("I love %s!", "cats")
+    logger.info("My cat's name is %s!", "Mia")
+    logger.info("Who do you like more, a %s or a %s?", "cat", "dog")
 
 
 if __name__ == "__main__":
@@ -1,29 +1,60 @@
+"""
+Configure a module-level logger with the `config_logger` function and use it.
+
+Pass values to the logger as arguments instead of formatting the message
+yourself::
+
+    logger.info("My cat's name is %s!", cat_name)
+
+The message is only formatted if the record is actually emitted, so
+suppressed records cost nothing. Guard expensive arguments with
+`logging.Logger.isEnabledFor`::
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Dogs: %s", expensive_report())
+"""
+
 import logging.config
 import os
 
-from meowlogs.config import ConfigLogging
+from meowlogs import ConfigLogging
 
 LOG_DIR = os.path.join(os.path.dirname(__file__), "dog")
 
 logger = None
+_configured = None
+
+
+def _is_active(logger: logging.Logger) -> bool:
+    # Another dictConfig call disables the logger and closes its file handlers
+    return not logger.disabled and all(
+        getattr(handler, "stream", True) is not None for handler in logger.handlers
+    )
 
 
 def config_logger(name_logger: str = "dog", directory: str = LOG_DIR):
+    global logger, _configured
+    if (
+        _configured == (name_logger, directory)
+        and logger is not None
+        and _is_active(logger)
+    ):
+        return
     config = ConfigLogging()
     config.add_default_formatter()
     config.add_console_handler()
     config.add_file_handler(directory)
     config.add_default_logger(name_logger)
-    logging.config.dictConfig(config)  # type: ignore[arg-type]
-    global logger
+    logging.config.dictConfig(config)
     logger = logging.getLogger(name_logger)
+    _configured = (name_logger, directory)
 
 
 def dog(name_logger: str = "dog", directory: str = LOG_DIR):
     config_logger(name_logger=name_logger, directory=directory)
-    logger.info("I like dogs better, but don't tell that to my cat Mia.")  # type: ignore[union-attr]
-    logger.info("I don't have a dog!")  # type: ignore[union-attr]
-    logger.info("Who do you like more, a cat or a dog?")  # type: ignore[union-attr]
+    logger.info("I like %s better, but don't tell that to my cat %s.", "dogs", "Mia")  # type: ignore[union-attr]
+    logger.info("I don't have a %s!", "dog")  # type: ignore[union-attr]
+    logger.info("Who do you like more, a %s or a %s?", "cat", "dog")  # type: ignore[union-attr]
 
 
 if __name__ == "__main__":
@@ -1,13 +1,12 @@
-import os
-import tempfile
 from datetime import datetime
+from pathlib import Path
 from unittest.mock import patch
 
 import pytest  # type: ignore[import-not-found]
 
 from meowlogs.config import ConfigLogging
 from meowlogs.handlers import TimedRotatingFileHandler
-from tests.enums import FileHandlerEnum
+from tests.enums import FileHandlerDefaults
 
 
 @pytest.fixture
@@ -17,16 +16,13 @@ def config_logging():
 
 
 @pytest.fixture
-def temp_dir():
-    """Creates a temporary directory for testing and ensures cleanup after the test."""
-    dir_path = tempfile.mkdtemp()
-    yield dir_path
-    for root, dirs, files in os.walk(dir_path, topdown=False):
-        for file in files:
-            os.remove(os.path.join(root, file))
-        for directory in dirs:
-            os.rmdir(os.path.join(root, directory))
-    os.rmdir(dir_path)
+def temp_dir(tmp_path_factory):
+    """Creates a temporary directory for testing.
+
+    Each test gets its own subdirectory of the session-scoped base
+    directory, which pytest removes as a whole instead of per test.
+    """
+    return str(tmp_path_factory.mktemp("logs"))
 
 
 @pytest.fixture
@@ -41,18 +37,18 @@ def temp_files(temp_dir):
     """
     filenames = ["file1.txt", "file2.txt", "invalid_name"]
     for name in filenames:
-        with open(os.path.join(temp_dir, name), "w") as f:
-            f.write("Sample content")
+        Path(temp_dir, name).touch()
     return filenames
 
 
 @pytest.fixture
-def mocked_datetime_now():
-    """Mock the datetime.now method to return a fixed value."""
-    with patch("meowlogs.handlers.datetime") as mock_datetime:
-        mock_datetime.now.return_value = datetime(2023, 10, 1)
-        mock_datetime.strftime = datetime.strftime
-        yield mock_datetime
+def mocked_time_now():
+    """Mock time.time to return a fixed value."""
+    now = datetime(2023, 10, 1)
+    with patch(
+        "meowlogs.handlers.time.time", return_value=now.timestamp()
+    ) as mock_time:
+        yield mock_time
 
 
 @pytest.fixture
@@ -63,12 +59,12 @@ def mock_logging_file():
 
 
 @pytest.fixture
-def handler(temp_dir, mock_logging_file, mocked_datetime_now):
+def handler(temp_dir, mock_logging_file, mocked_time_now):
     """Create a test instance of TimedRotatingFileHandler with mocked dependencies."""
     handler = TimedRotatingFileHandler(
         directory=temp_dir,
-        suffix=FileHandlerEnum.SUFFIX.value,
-        backup_count=FileHandlerEnum.BACKUP_COUNT.value,
-        level=FileHandlerEnum.LEVEL.value,
+        suffix=FileHandlerDefaults.SUFFIX,
+        backup_count=FileHandlerDefaults.BACKUP_COUNT,
+        level=FileHandlerDefaults.LEVEL,
     )
     return handler
@@ -1,7 +1,4 @@
-from enum import Enum
-
-
-class FileHandlerEnum(Enum):
+class FileHandlerDefaults:
     SUFFIX = "%Y-%m-%d"
     BACKUP_COUNT = 3
     LEVEL = "DEBUG"  # 10
@@ -1,3 +1,25 @@
+import pytest  # type: ignore[import-not-found]
+
+from meowlogs.config import ConfigLogging, lazy_repr
+
+_EXPECTED_KEYS = (
+    "version",
+    "disable_existing_loggers",
+    "formatters",
+    "handlers",
+    "loggers",
+)
+_DEFAULT_LOGGER_HANDLERS = ("file", "console")
+_EXPECTED_DJANGO_FORMATTER = {
+    "()": "django.utils.log.ServerFormatter",
+    "format": (
+        "[%(name)s %(levelname)s %(asctime)s %(filename)s: %(lineno)d"
+        " - %(funcName)s()] %(message)s"
+    ),
+    "datefmt": "%Y-%m-%d %H:%M:%S",
+}
+
+
 def test_initial_configuration(config_logging):
     """Test the default configuration of ConfigLogging."""
     assert config_logging["version"] == 1
@@ -5,90 +27,116 @@ def test_initial_configuration(config_logging):
     assert config_logging["formatters"] == {}
     assert config_logging["handlers"] == {}
     assert config_logging["loggers"] == {}
+    assert config_logging == ConfigLogging.default_config
 
 
 def test_set_and_get_item(config_logging):
     """Test setting and getting configuration items."""
     config_logging["version"] = 2
-    config_logging["test_key"] = "test_value"
+    config_logging["root"] = {"level": "INFO"}
     assert config_logging["version"] == 2
-    assert config_logging["test_key"] is None
+    assert config_logging["root"] == {"level": "INFO"}
 
 
 def test_del_item(config_logging):
-    """Test that deleting an item does not change the configuration."""
-    # __delitem__ doesn't perform any operation
-    del config_logging["version"]
-    assert "version" in config_logging
+    """Test deleting an item from the configuration."""
+    del config_logging["loggers"]
+    assert "loggers" not in config_logging
+
+
+def test_instances_do_not_share_sections():
+    """Test that every configuration gets its own nested sections."""
+    first, second = ConfigLogging(), ConfigLogging()
+    first.add_formatter("custom_formatter", {"format": "%(message)s"})
+    assert second["formatters"] == {}
+    assert ConfigLogging.default_config["formatters"] == {}
+
+
+def test_default_config_is_read_only():
+    """Test that the shared default configuration cannot be modified."""
+    with pytest.raises(TypeError):
+        ConfigLogging.default_config["version"] = 2
 
 
 def test_iter_keys(config_logging):
     """Test iterating over configuration keys."""
-    expected_keys = [
-        "version",
-        "disable_existing_loggers",
-        "formatters",
-        "handlers",
-        "loggers",
-    ]
-    assert list(config_logging.__iter__()) == expected_keys
+    assert tuple(iter(config_logging)) == _EXPECTED_KEYS
 
 
 def test_len(config_logging):
     """Test the length of the configuration (number of keys)."""
-    assert len(config_logging) == len(config_logging.__dict__)
+    assert len(config_logging) == 5
 
 
 def test_repr(config_logging):
     """Test the string representation of the configuration."""
-    assert repr(config_logging) == repr(config_logging.__dict__)
+    assert repr(config_logging) == f"ConfigLogging(keys={list(_EXPECTED_KEYS)})"
 
 
-def test_add_formatter(config_logging):
-    """Test adding a formatter to the configuration."""
-    formatter = {"format": "%(asctime)s - %(message)s"}
-    config_logging.add_formatter("custom_formatter", formatter)
-    assert "custom_formatter" in config_logging["formatters"]
-    assert config_logging["formatters"]["custom_formatter"] == formatter
+def test_lazy_repr(config_logging):
+    """Test that lazy_repr shows the whole configuration when formatted."""
+    config_logging.add_default_formatter()
+    wrapped = lazy_repr(config_logging)
+    config_logging.add_console_handler()
+    output = f"{wrapped}"
+    assert output == repr(dict(config_logging))
+    assert "'version': 1" in output
+    assert "'console'" in output
+
+
+@pytest.mark.parametrize(
+    "method_name, section, key, payload",
+    [
+        (
+            "add_formatter",
+            "formatters",
+            "custom_formatter",
+            {"format": "%(asctime)s - %(message)s"},
+        ),
+        (
+            "add_handler",
+            "handlers",
+            "custom_handler",
+            {"class": "logging.StreamHandler", "level": "DEBUG"},
+        ),
+        (
+            "add_logger",
+            "loggers",
+            "custom_logger",
+            {"level": "DEBUG", "handlers": ["console"]},
+        ),
+    ],
+)
+def test_add_entry(config_logging, method_name, section, key, payload):
+    """Test adding a formatter, handler or logger to the configuration."""
+    getattr(config_logging, method_name)(key, payload)
+    entries = config_logging[section]
+    assert key in entries
+    assert entries[key] == payload
 
 
 def test_add_default_formatter(config_logging):
     """Test adding the default formatter."""
     config_logging.add_default_formatter()
-    assert "formatter" in config_logging["formatters"]
-    assert (
-        "format" in config_logging["formatters"]["formatter"]
-    )  # Check that default format exists
+    formatters = config_logging["formatters"]
+    assert "formatter" in formatters
+    assert "format" in formatters["formatter"]  # Check that default format exists
 
 
 def test_add_default_django_formatter(config_logging):
     """Test adding the default Django-specific formatter."""
     config_logging.add_default_django_formatter()
-    formater = {
-        "()": "django.utils.log.ServerFormatter",
-        "format": (
-            "[%(name)s %(levelname)s %(asctime)s %(filename)s: %(lineno)d"
-            " - %(funcName)s()] %(message)s"
-        ),
-        "datefmt": "%Y-%m-%d %H:%M:%S",
-    }
-    assert "formatter" in config_logging["formatters"]
-    assert config_logging["formatters"]["formatter"] == formater
-
-
-def test_add_handler(config_logging):
-    """Test adding a handler to the configuration."""
-    handler = {"class": "logging.StreamHandler", "level": "DEBUG"}
-    config_logging.add_handler("custom_handler", handler)
-    assert "custom_handler" in config_logging["handlers"]
-    assert config_logging["handlers"]["custom_handler"] == handler
+    formatters = config_logging["formatters"]
+    assert "formatter" in formatters
+    assert formatters["formatter"] == _EXPECTED_DJANGO_FORMATTER
 
 
 def test_add_console_handler(config_logging):
     """Test adding a console logging handler to the configuration."""
     config_logging.add_console_handler()
-    assert "console" in config_logging["handlers"]
-    _handler = config_logging["handlers"]["console"]
+    handlers = config_logging["handlers"]
+    assert "console" in handlers
+    _handler = handlers["console"]
     assert _handler["level"] == "INFO"
     assert _handler["class"] == "logging.StreamHandler"
     assert _handler["formatter"] == "formatter"
@@ -99,27 +147,31 @@ def test_add_file_handler(config_logging):
     """Test adding a file logging handler to the configuration."""
     directory = "/logs/"
     config_logging.add_file_handler(directory)
-    assert "file" in config_logging["handlers"]
-    _handler = config_logging["handlers"]["file"]
+    handlers = config_logging["handlers"]
+    assert "file" in handlers
+    _handler = handlers["file"]
     assert _handler["level"] == "INFO"
     assert _handler["class"] == "meowlogs.handlers.TimedRotatingFileHandler"
     assert _handler["formatter"] == "formatter"
     assert _handler["directory"] == directory
 
-
-def test_add_logger(config_logging):
-    """Test adding a logger to the configuration."""
-    logger = {"level": "DEBUG", "handlers": ["console"]}
-    config_logging.add_logger("custom_logger", logger)
-    assert "custom_logger" in config_logging["loggers"]
-    assert config_logging["loggers"]["custom_logger"] == logger
+    config_logging.add_file_handler("/other_logs/", name="other_file")
+    assert handlers["other_file"]["directory"] == "/other_logs/"
+    assert handlers["file"]["directory"] == directory
 
 
 def test_add_default_logger(config_logging):
     """Test adding a default logger to the configuration."""
     config_logging.add_default_logger("default_logger")
-    assert "default_logger" in config_logging["loggers"]
-    logger = config_logging["loggers"]["default_logger"]
-    assert logger["handlers"] == ("file", "console")
+    loggers = config_logging["loggers"]
+    assert "default_logger" in loggers
+    logger = loggers["default_logger"]
+    assert isinstance(logger, dict)
+    assert logger["handlers"] == _DEFAULT_LOGGER_HANDLERS
     assert logger["level"] == "INFO"
     assert logger["propagate"] is False
+
+
+def test_no_instance_dict(config_logging):
+    """Test that the configuration stores nothing outside its dict items."""
+    assert not hasattr(config_logging, "__dict__")
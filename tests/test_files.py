@@ -1,7 +1,9 @@
 import os
 from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
 
-from meowlogs.files import Directory, File, LoggingFile
+from meowlogs.files import Directory, File, LoggingFile, _strptime
 
 
 # Tests for Directory class
@@ -14,7 +16,7 @@ def test_directory_exist(temp_dir):
     dir_path = os.path.join(temp_dir, "new_directory")
     directory = Directory(dir_path)
     directory.directory_exist()
-    assert os.path.exists(dir_path) and os.path.isdir(dir_path)
+    assert os.path.isdir(dir_path)
 
 
 def test_join_directories(temp_dir):
@@ -49,9 +51,10 @@ def test_get_file_names(temp_dir, temp_files):
         temp_dir (str): Temporary directory path.
         temp_files (list[str]): List of temporary file names in the directory.
     """
+    os.mkdir(os.path.join(temp_dir, "subdir"))
     file = File(temp_dir)
     files = file.get_file_names()
-    assert sorted(files) == sorted(temp_files)
+    assert set(files) == set(temp_files)
 
 
 def test_file_exist(temp_dir):
@@ -61,8 +64,7 @@ def test_file_exist(temp_dir):
         temp_dir (str): Temporary directory path.
     """
     temp_file_path = os.path.join(temp_dir, "test.txt")
-    with open(temp_file_path, "w") as f:
-        f.write("Test file content")
+    Path(temp_file_path).touch()
     assert File.file_exist(temp_file_path)
     os.remove(temp_file_path)
     assert not File.file_exist(temp_file_path)
@@ -72,6 +74,9 @@ def test_file_exist(temp_dir):
 def test_filename_datetime(temp_dir, temp_files):
     """Tests sorting and filtering of file names based on datetime suffix.
 
+    Only names are processed, so no log files are created; `delete_file`
+    is mocked to record the invalid names.
+
     Args:
         temp_dir (str): Temporary directory path.
         temp_files (list[str]): List of temporary file names in the directory.
@@ -79,24 +84,19 @@ def test_filename_datetime(temp_dir, temp_files):
     suffix = "%Y-%m-%d"
     logging_file = LoggingFile(temp_dir, suffix, backup_count=5)
 
-    # Creating files with correct and incorrect suffix formats
+    # File names with correct suffix format, in reverse order
     valid_files = [
-        f"2023-11-{str(i).zfill(2)}" for i in range(1, 6)
+        f"2023-11-{i:02d}" for i in range(5, 0, -1)
     ]  # Files with valid suffix
-    for file_name in valid_files:
-        with open(os.path.join(temp_dir, file_name), "w") as f:
-            f.write("Log file")
 
-    # Attempt to sort and exclude invalid files
-    sorted_files = logging_file.filename_datetime(
-        temp_files + valid_files
-    )  # Includes temp_files + valid suffix files
-    assert sorted_files == sorted(
-        valid_files, key=lambda x: datetime.strptime(x, suffix)
-    )
-    assert all(
-        file not in os.listdir(temp_dir) for file in temp_files
-    )  # Invalid files should be deleted
+    with patch.object(LoggingFile, "delete_file") as mock_delete_file:
+        sorted_files = logging_file.filename_datetime(
+            temp_files + valid_files
+        )  # Includes temp_files + valid suffix files
+    # "%Y-%m-%d" names sort lexically in chronological order
+    assert sorted_files == sorted(valid_files)
+    # Invalid files should be deleted
+    assert [call.args[0] for call in mock_delete_file.call_args_list] == (temp_files)
 
 
 def test_file_to_delete(temp_dir):
@@ -109,12 +109,87 @@ def test_file_to_delete(temp_dir):
     logging_file = LoggingFile(temp_dir, suffix, backup_count=3)
 
     # Create 5 files with valid suffixes
-    valid_files = [f"2023-11-{str(i).zfill(2)}" for i in range(1, 6)]
+    valid_files = [f"2023-11-{i:02d}" for i in range(1, 6)]
+    base = Path(temp_dir)
     for file_name in valid_files:
-        with open(os.path.join(temp_dir, file_name), "w") as f:
-            f.write("Log file")
+        (base / file_name).touch()
 
     # Ensure it only keeps the most recent 3 files
     logging_file.file_to_delete()
     remaining_files = logging_file.get_file_names()  # Only 3 newest files
-    assert remaining_files == valid_files[3:]
+    assert set(remaining_files) == set(valid_files[3:])
+
+
+def test_file_to_delete_scans_once(temp_dir):
+    """Tests that the directory is scanned once without a stat per file.
+
+    Args:
+        temp_dir (str): Temporary directory path.
+    """
+    logging_file = LoggingFile(temp_dir, "%Y-%m-%d", backup_count=3)
+    base = Path(temp_dir)
+    names = [f"2023-{i // 28 + 1:02d}-{i % 28 + 1:02d}" for i in range(100)]
+    for name in names:
+        (base / name).touch()
+
+    with patch("meowlogs.files.os.scandir", wraps=os.scandir) as mock_scandir, patch(
+        "meowlogs.files.os.stat"
+    ) as mock_stat:
+        logging_file.file_to_delete()
+    mock_scandir.assert_called_once_with(temp_dir)
+    mock_stat.assert_not_called()
+    assert sorted(os.listdir(temp_dir)) == names[-2:]
+
+
+def test_parse_date(temp_dir):
+    """Tests parsing file names with compiled and fallback suffixes.
+
+    Args:
+        temp_dir (str): Temporary directory path.
+    """
+    logging_file = LoggingFile(temp_dir, "%Y-%m-%d_%H", backup_count=3)
+    assert logging_file.parse_date("2023-11-05_13") == datetime(2023, 11, 5, 13)
+    assert logging_file.parse_date("2023-13-05_13") is None
+    assert logging_file.parse_date("invalid_name") is None
+
+    # %b is not compiled and falls back to datetime.strptime
+    logging_file = LoggingFile(temp_dir, "%Y-%b-%d", backup_count=3)
+    assert logging_file.parse_date("2023-Nov-05") == datetime(2023, 11, 5)
+
+
+def test_parse_date_caches_fallback(temp_dir):
+    """Tests that names parsed by the strptime fallback are parsed once.
+
+    Args:
+        temp_dir (str): Temporary directory path.
+    """
+    _strptime.cache_clear()
+    logging_file = LoggingFile(temp_dir, "%Y-%b-%d", backup_count=3)
+    for _ in range(2):
+        assert logging_file.parse_date("2023-Dec-05") == datetime(2023, 12, 5)
+    assert _strptime.cache_info().misses == 1
+    assert _strptime.cache_info().hits == 1
+
+
+def test_filename_datetime_keeps_original_names(temp_dir):
+    """Tests that names parsed by the strptime fallback are returned unchanged.
+
+    Args:
+        temp_dir (str): Temporary directory path.
+    """
+    logging_file = LoggingFile(temp_dir, "%Y-%m-%d", backup_count=3)
+    names = logging_file.filename_datetime(["2023-11-10", "2023-11-9"])
+    assert names == ["2023-11-9", "2023-11-10"]
+
+
+def test_file_to_delete_below_backup_count(temp_dir, temp_files):
+    """Tests that stray files are removed while there are too few backups.
+
+    Args:
+        temp_dir (str): Temporary directory path.
+        temp_files (list[str]): List of temporary file names in the directory.
+    """
+    Path(temp_dir, "2023-10-01").touch()
+    logging_file = LoggingFile(temp_dir, "%Y-%m-%d", backup_count=5)
+    logging_file.file_to_delete()
+    assert os.listdir(temp_dir) == ["2023-10-01"]
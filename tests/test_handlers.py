@@ -1,8 +1,30 @@
+import fcntl
+import gc
+import logging
 import os
-from logging import LogRecord
-from unittest.mock import patch
+import queue
+import threading
+import weakref
+from copy import copy
+from datetime import datetime
+from logging import Formatter, LogRecord
+from pathlib import Path
+from unittest.mock import MagicMock, patch
 
-from tests.enums import FileHandlerEnum
+import pytest  # type: ignore[import-not-found]
+
+from meowlogs.handlers import TimedRotatingFileHandler
+from tests.enums import FileHandlerDefaults
+
+_TEST_RECORD = LogRecord(
+    name="test_logger",
+    level=20,  # INFO
+    pathname="test_path",
+    lineno=10,
+    msg="Test log message",
+    args=None,
+    exc_info=None,
+)
 
 
 def test_initialization(handler, mock_logging_file):
@@ -15,16 +37,17 @@ def test_initialization(handler, mock_logging_file):
         - The directory, suffix, and backup_count are set correctly.
         - LoggingFile is initialized with the expected arguments.
     """
-    assert handler._suffix == FileHandlerEnum.SUFFIX.value
-    assert handler._backup_count == FileHandlerEnum.BACKUP_COUNT.value
+    assert handler._suffix == FileHandlerDefaults.SUFFIX
+    assert handler._backup_count == FileHandlerDefaults.BACKUP_COUNT
     assert handler._level == 10  # DEBUG level
+    assert handler.level == 10
 
 
-def test_get_filename(handler, mocked_datetime_now):
+def test_get_filename(handler, mocked_time_now):
     """Tests the `get_filename` method to ensure the filename is generated correctly.
     Args:
         handler (TimedRotatingFileHandler): The handler instance under test.
-        mocked_datetime_now (MagicMock): Mocked datetime for generating filenames.
+        mocked_time_now (MagicMock): Mocked time.time for generating filenames.
 
     Assertions:
         filename (str): Verifies that the filename matches the expected pattern based on the date.
@@ -33,6 +56,28 @@ def test_get_filename(handler, mocked_datetime_now):
     assert filename == handler._directory + "/2023-10-01"
 
 
+def test_get_filename_is_cached(handler):
+    """Tests that the filename is formatted once per second.
+
+    Args:
+        handler (TimedRotatingFileHandler): The handler instance under test.
+
+    Assertions:
+        - A second call within the same second does not call `strftime`.
+        - The name is formatted again in the next second.
+    """
+    with patch("meowlogs.handlers.time.time", return_value=1000.0), patch(
+        "meowlogs.handlers.time.strftime", return_value="2023-10-01"
+    ) as mock_strftime:
+        assert handler.get_filename() == handler._prefix + "2023-10-01"
+        assert handler.get_filename() == handler._prefix + "2023-10-01"
+        assert mock_strftime.call_count == 1
+    with patch("meowlogs.handlers.time.time", return_value=1001.0), patch(
+        "meowlogs.handlers.time.strftime", return_value="2023-10-02"
+    ):
+        assert handler.get_filename() == handler._prefix + "2023-10-02"
+
+
 def test_file_rollover(handler, mock_logging_file):
     """Test the file rollover logic with the do_rollover method.
 
@@ -42,10 +87,17 @@ def test_file_rollover(handler, mock_logging_file):
 
     Asserts:
         - The baseFilename is updated to the new filename after rollover.
+        - An absolute filename is used without resolving the working directory.
+        - The old stream is closed and the new one is open.
     """
     path = os.path.join(handler._directory, "2023-10-02")
-    handler.do_rollover(path)
+    old_stream = handler.stream
+    with patch("os.getcwd") as mock_getcwd:
+        handler.do_rollover(path)
+    mock_getcwd.assert_not_called()  # The path is already absolute
     assert handler.baseFilename == os.path.abspath(path)
+    assert old_stream.closed
+    assert not handler.stream.closed
 
 
 def test_write_record_to_file(handler):
@@ -57,42 +109,712 @@ def test_write_record_to_file(handler):
         - The log message is written correctly to the stream.
         - File locking (fcntl) is used properly during the write.
     """
+    record = copy(_TEST_RECORD)
+    handler.write_record_to_file(record)
+
+
+def test_emit_with_rollover(handler, mock_logging_file, monkeypatch):
+    """Test the emit method, including log file rotation logic.
+
+    Args:
+        handler (TimedRotatingFileHandler): The handler instance under test.
+        mock_logging_file (MagicMock): Mocked LoggingFile class.
+        monkeypatch (MonkeyPatch): Pytest fixture for patching attributes.
+
+    Asserts:
+        - The log record is written correctly if within the log level.
+        - Log file rollover (do_rollover) is triggered when necessary.
+    """
+    record = copy(_TEST_RECORD)
+    mock_get_filename = MagicMock(return_value=handler._directory + "/2023-10-01")
+    mock_do_rollover = MagicMock()
+    mock_write_record = MagicMock()
+    monkeypatch.setattr(handler, "get_filename", mock_get_filename)
+    monkeypatch.setattr(handler, "do_rollover", mock_do_rollover)
+    monkeypatch.setattr(handler, "write_record_to_file", mock_write_record)
+    handler._next_rollover = 0.0
+    handler.emit(record)
+    mock_do_rollover.assert_not_called()
+
+    # Simulate filename change for rollover
+    mock_get_filename.return_value = handler._directory + "/2023-10-02"
+    handler._next_rollover = 0.0
+    handler.emit(record)
+    mock_do_rollover.assert_called_once_with(handler._directory + "/2023-10-02")
+    assert mock_write_record.call_count == 2
+
+
+def test_write_record_is_buffered(handler):
+    """Tests that a record stays buffered until the flush interval elapses.
+
+    Args:
+        handler (TimedRotatingFileHandler): The handler instance under test.
+
+    Assertions:
+        - The record is not on disk right after it is written.
+        - The record is on disk once the interval has elapsed.
+    """
+    record = copy(_TEST_RECORD)
+    handler.write_record_to_file(record)
+    with open(handler.baseFilename) as f:
+        assert f.read() == ""
+
+    handler._last_flush -= handler._flush_interval
+    handler.write_record_to_file(record)
+    with open(handler.baseFilename) as f:
+        assert f.read() == "Test log message\n" * 2
+
+
+def test_write_record_with_flock(handler):
+    """Tests that `use_flock` locks and flushes every record.
+
+    Args:
+        handler (TimedRotatingFileHandler): The handler instance under test.
+
+    Assertions:
+        - The file is locked and unlocked around the write, for short and
+          long records alike.
+        - Every record is on disk right after it is written.
+    """
+    record = copy(_TEST_RECORD)
+    handler._use_flock = True
+    with patch("meowlogs.handlers._flock") as mock_flock:
+        handler.write_record_to_file(record)
+    assert mock_flock.call_count == 2
+    with open(handler.baseFilename) as f:
+        assert f.read() == "Test log message\n"
+
+    record.msg = "x" * 5000
+    with patch("meowlogs.handlers._flock") as mock_flock:
+        handler.write_record_to_file(record)
+    assert mock_flock.call_count == 2
+    with open(handler.baseFilename) as f:
+        assert f.read() == "Test log message\n" + "x" * 5000 + "\n"
+
+
+def test_emit_async(temp_dir, mock_logging_file, mocked_time_now):
+    """Tests that the "async" write mode writes records on a background thread.
+
+    Args:
+        temp_dir (str): Path to the temporary directory.
+        mock_logging_file (MagicMock): Mocked LoggingFile class.
+        mocked_time_now (MagicMock): Mocked time.time for generating filenames.
+
+    Assertions:
+        - Every queued record is on disk after `flush`.
+        - The background writer is stopped by `close`.
+    """
+    handler = TimedRotatingFileHandler(
+        directory=temp_dir,
+        suffix=FileHandlerDefaults.SUFFIX,
+        backup_count=FileHandlerDefaults.BACKUP_COUNT,
+        level=FileHandlerDefaults.LEVEL,
+        write_mode="async",
+    )
+    writer = handler._writer
+    record = copy(_TEST_RECORD)
+    for _ in range(3):
+        handler.emit(record)
+    handler.flush()
+    with open(handler.baseFilename) as f:
+        assert f.read() == "Test log message\n" * 3
+
+    handler.close()
+    assert handler._writer is None
+    assert not writer.is_alive()
+
+
+def test_emit_skips_rollover_check(handler):
+    """Tests that emit does not compute the filename before the next rollover.
+
+    Args:
+        handler (TimedRotatingFileHandler): The handler instance under test.
+
+    Asserts:
+        - `get_filename` is not called while the next rollover is ahead.
+        - The record is still written.
+    """
+    record = copy(_TEST_RECORD)
+    handler._next_rollover = float("inf")
+    with patch.object(handler, "get_filename") as mock_get_filename:
+        handler.emit(record)
+    mock_get_filename.assert_not_called()
+    handler.flush()
+    with open(handler.baseFilename) as f:
+        assert f.read() == "Test log message\n"
+
+
+def test_get_next_rollover(handler):
+    """Tests the next rollover time for daily and sub-day suffixes.
+
+    Args:
+        handler (TimedRotatingFileHandler): The handler instance under test.
+
+    Asserts:
+        - A daily suffix rolls over at the next midnight.
+        - Suffixes with hours, minutes or seconds roll over at the next one.
+    """
+    assert handler.get_next_rollover() == datetime(2023, 10, 2).timestamp()
+    for suffix, expected in (
+        ("%Y-%m-%d_%H", datetime(2023, 10, 1, 1)),
+        ("%Y-%m-%d_%H-%M", datetime(2023, 10, 1, 0, 1)),
+        ("%Y-%m-%d_%H-%M-%S", datetime(2023, 10, 1, 0, 0, 1)),
+    ):
+        handler._suffix = suffix
+        assert handler.get_next_rollover() == expected.timestamp()
+
+
+def test_check_rollover_reads_the_clock_once(handler, mocked_time_now):
+    """Tests that the filename and the next rollover use the same time.
+
+    Args:
+        handler (TimedRotatingFileHandler): The handler instance under test.
+        mocked_time_now (MagicMock): Mocked time.time for generating filenames.
+
+    Asserts:
+        - A clock crossing midnight between two reads does not pair the
+          old day's filename with the next day's rollover time.
+    """
+    mocked_time_now.side_effect = [
+        datetime(2023, 10, 1, 23, 59, 59, 900000).timestamp(),
+        datetime(2023, 10, 2, 0, 0, 0, 100000).timestamp(),
+    ]
+    handler.check_rollover()
+    assert handler._filename == handler._prefix + "2023-10-01"
+    assert handler._next_rollover == datetime(2023, 10, 2).timestamp()
+
+
+def test_get_level_logging(handler):
+    """Tests the conversion of level names to numeric log levels.
+
+    Args:
+        handler (TimedRotatingFileHandler): The handler instance under test.
+
+    Asserts:
+        - Level names and their aliases map to their numeric values.
+        - Unknown level names fall back to INFO.
+    """
+    assert handler.get_level_logging("WARN") == 30
+    assert handler.get_level_logging("CRITICAL") == 50
+    assert handler.get_level_logging("VERBOSE") == 20
+
+
+def test_check_rollover_removes_old_files_once(handler, mock_logging_file):
+    """Tests that old log files are only removed when the filename changes.
+
+    Args:
+        handler (TimedRotatingFileHandler): The handler instance under test.
+        mock_logging_file (MagicMock): Mocked LoggingFile class.
+
+    Asserts:
+        - No cleanup happens while the filename stays the same.
+        - One cleanup happens on rollover.
+    """
+    file_to_delete = mock_logging_file.return_value.file_to_delete
+    handler.check_rollover()
+    file_to_delete.assert_not_called()
+
+    with patch.object(handler, "get_filename") as mock_get_filename:
+        mock_get_filename.return_value = handler._directory + "/2023-10-02"
+        handler.check_rollover()
+        handler.check_rollover()
+    handler.close()  # Waits for the cleanup thread
+    file_to_delete.assert_called_once()
+    assert handler._needs_cleanup is False
+
+
+def test_remove_old_files_reports_errors(handler, mock_logging_file, capsys):
+    """Tests that errors raised while removing old files are not lost.
+
+    Args:
+        handler (TimedRotatingFileHandler): The handler instance under test.
+        mock_logging_file (MagicMock): Mocked LoggingFile class.
+        capsys (CaptureFixture): Pytest fixture capturing stderr.
+
+    Asserts:
+        - The traceback of the failed cleanup is printed to stderr.
+    """
+    file_to_delete = mock_logging_file.return_value.file_to_delete
+    file_to_delete.side_effect = OSError("cannot remove old log file")
+    handler._needs_cleanup = True
+    handler.remove_old_files()
+    handler.close()  # Waits for the cleanup thread
+    assert "OSError: cannot remove old log file" in capsys.readouterr().err
+
+
+def test_stream_is_opened_in_append_mode(handler):
+    """Tests that the log file descriptor is opened with O_APPEND.
+
+    Args:
+        handler (TimedRotatingFileHandler): The handler instance under test.
+
+    Asserts:
+        - The O_APPEND flag is set on the stream's file descriptor.
+    """
+    flags = fcntl.fcntl(handler.stream.fileno(), fcntl.F_GETFL)
+    assert flags & os.O_APPEND
+
+
+def test_format_fast_path(handler):
+    """Tests that the fast format path matches `logging.Formatter.format`.
+
+    Args:
+        handler (TimedRotatingFileHandler): The handler instance under test.
+
+    Asserts:
+        - A plain formatter gives the same output as `Formatter.format`.
+        - A formatter overriding `format` is still used.
+    """
     record = LogRecord(
         name="test_logger",
         level=20,  # INFO
         pathname="test_path",
         lineno=10,
-        msg="Test log message",
-        args=None,
+        msg="Test %s message",
+        args=("log",),
         exc_info=None,
     )
-    handler.write_record_to_file(record)
+    formatter = Formatter("%(asctime)s %(name)s: %(message)s")
+    handler.setFormatter(formatter)
+    assert handler.format(record) == formatter.format(record)
 
+    class UpperFormatter(Formatter):
+        def format(self, record):
+            return super().format(record).upper()
+
+    handler.setFormatter(UpperFormatter())
+    assert handler.format(record) == "TEST LOG MESSAGE"
 
-def test_emit_with_rollover(handler, mock_logging_file):
-    """Test the emit method, including log file rotation logic.
+
+def test_format_without_formatter(handler):
+    """Tests that records are formatted as their message without a formatter.
 
     Args:
         handler (TimedRotatingFileHandler): The handler instance under test.
-        mock_logging_file (MagicMock): Mocked LoggingFile class.
 
     Asserts:
-        - The log record is written correctly if within the log level.
-        - Log file rollover (do_rollover) is triggered when necessary.
+        - The default formatter is not called for a plain record.
+        - The output matches the default formatter.
     """
     record = LogRecord(
         name="test_logger",
         level=20,  # INFO
         pathname="test_path",
         lineno=10,
-        msg="Test log message",
-        args=None,
+        msg="Test %s message",
+        args=("log",),
         exc_info=None,
     )
-    with patch.object(handler, "get_filename") as mock_get_filename:
-        mock_get_filename.return_value = handler._directory + "/2023-10-01"
-        handler.emit(record)
+    expected = logging._defaultFormatter.format(record)
+    with patch.object(logging._defaultFormatter, "format") as mock_format:
+        assert handler.format(record) == expected
+    mock_format.assert_not_called()
+    assert record.message == "Test log message"
+
+
+def test_logging_file_created_on_first_rollover(handler, mock_logging_file):
+    """Tests that LoggingFile is only created once a rollover needs it.
 
-        # Simulate filename change for rollover
+    Args:
+        handler (TimedRotatingFileHandler): The handler instance under test.
+        mock_logging_file (MagicMock): Mocked LoggingFile class.
+
+    Asserts:
+        - LoggingFile is not created by the constructor.
+        - LoggingFile is created once with the handler's settings.
+    """
+    mock_logging_file.assert_not_called()
+    with patch.object(handler, "get_filename") as mock_get_filename:
         mock_get_filename.return_value = handler._directory + "/2023-10-02"
-        handler.emit(record)
+        handler.check_rollover()
+    mock_logging_file.assert_called_once_with(
+        handler._directory,
+        FileHandlerDefaults.SUFFIX,
+        FileHandlerDefaults.BACKUP_COUNT + 1,
+    )
+
+
+def test_validate_suffix(handler):
+    """Tests that an invalid suffix falls back to the default date format.
+
+    Args:
+        handler (TimedRotatingFileHandler): The handler instance under test.
+
+    Asserts:
+        - A valid suffix is kept.
+        - A suffix that cannot format a date is replaced by "%Y-%m-%d".
+        - A suffix with microseconds, which `time.strftime` does not
+          format, is replaced by "%Y-%m-%d".
+        - Each replacement is reported with a warning.
+    """
+    assert handler.validate_suffix("%Y_%m") == "%Y_%m"
+    assert handler.validate_suffix("%Y_%%f") == "%Y_%%f"
+    for suffix in ("%Y\0", "%Y-%m-%d_%H-%M-%S.%f", "%Y_%%%f"):
+        with pytest.warns(UserWarning, match="Invalid log file suffix"):
+            assert handler.validate_suffix(suffix) == "%Y-%m-%d"
+
+
+def test_rollover_keeps_backup_count(temp_dir, mocked_time_now):
+    """Tests that the background cleanup keeps `backup_count` log files.
+
+    Args:
+        temp_dir (str): Path to the temporary directory.
+        mocked_time_now (MagicMock): Mocked time.time for generating filenames.
+
+    Asserts:
+        - The cleanup runs on a background thread.
+        - The newest files, including the new log file, are kept.
+    """
+    for day in ("2023-09-28", "2023-09-29", "2023-09-30"):
+        Path(temp_dir, day).touch()
+    handler = TimedRotatingFileHandler(
+        directory=temp_dir,
+        suffix=FileHandlerDefaults.SUFFIX,
+        backup_count=FileHandlerDefaults.BACKUP_COUNT,
+    )
+    with patch.object(handler, "get_filename") as mock_get_filename:
+        mock_get_filename.return_value = handler._prefix + "2023-10-02"
+        handler.check_rollover()
+    assert handler._cleanup_executor is not None
+    handler.close()
+    assert sorted(os.listdir(temp_dir)) == [
+        "2023-09-30",
+        "2023-10-01",
+        "2023-10-02",
+    ]
+
+
+def test_handle_batch(handler):
+    """Tests that a batch of records is written with a single write call.
+
+    Args:
+        handler (TimedRotatingFileHandler): The handler instance under test.
+
+    Asserts:
+        - Records below the handler level are skipped.
+        - The other records are written to the stream at once.
+    """
+    record = copy(_TEST_RECORD)
+    skipped = LogRecord(
+        name="test_logger",
+        level=5,
+        pathname="test_path",
+        lineno=10,
+        msg="Skipped message",
+        args=None,
+        exc_info=None,
+    )
+    stream = handler.stream
+    with patch.object(stream, "write", wraps=stream.write) as mock_write:
+        handler.handle_batch([record] * 10 + [skipped])
+    mock_write.assert_called_once_with("Test log message\n" * 10)
+    handler.flush()
+    with open(handler.baseFilename) as f:
+        assert f.read() == "Test log message\n" * 10
+
+
+def test_handle_async_formats_under_lock(temp_dir, mock_logging_file, mocked_time_now):
+    """Tests that "async" write mode formats records under the handler lock.
+
+    Args:
+        temp_dir (str): Path to the temporary directory.
+        mock_logging_file (MagicMock): Mocked LoggingFile class.
+        mocked_time_now (MagicMock): Mocked time.time for generating filenames.
+
+    Asserts:
+        - The handler lock is taken for queued records.
+        - Installed filters are still applied.
+    """
+    handler = TimedRotatingFileHandler(
+        directory=temp_dir,
+        suffix=FileHandlerDefaults.SUFFIX,
+        backup_count=FileHandlerDefaults.BACKUP_COUNT,
+        level=FileHandlerDefaults.LEVEL,
+        write_mode="async",
+    )
+    record = copy(_TEST_RECORD)
+    with patch.object(handler, "acquire") as mock_acquire, patch.object(
+        handler, "release"
+    ):
+        assert handler.handle(record)
+    mock_acquire.assert_called_once_with()
+
+    handler.addFilter(lambda record: False)
+    assert not handler.handle(copy(_TEST_RECORD))
+    handler.flush()
+    with open(handler.baseFilename) as f:
+        assert f.read() == "Test log message\n"
+    handler.close()
+
+
+def test_handle_batch_reports_failing_record(
+    temp_dir, mock_logging_file, mocked_time_now
+):
+    """Tests that a failed batch write reports the record that failed.
+
+    Args:
+        temp_dir (str): Path to the temporary directory.
+        mock_logging_file (MagicMock): Mocked LoggingFile class.
+        mocked_time_now (MagicMock): Mocked time.time for generating filenames.
+
+    Asserts:
+        - Only the record that cannot be written is passed to `handleError`.
+        - The other records of the batch are written.
+    """
+    handler = TimedRotatingFileHandler(
+        directory=temp_dir,
+        suffix=FileHandlerDefaults.SUFFIX,
+        backup_count=FileHandlerDefaults.BACKUP_COUNT,
+        level=FileHandlerDefaults.LEVEL,
+        encoding="ascii",
+    )
+    unencodable = copy(_TEST_RECORD)
+    unencodable.msg = "Caf\u00e9"
+    with patch.object(handler, "handleError") as mock_handle_error:
+        handler.handle_batch([copy(_TEST_RECORD), unencodable, copy(_TEST_RECORD)])
+    mock_handle_error.assert_called_once_with(unencodable)
+    handler.close()
+    with open(handler.baseFilename) as f:
+        assert f.read() == "Test log message\n" * 2
+
+
+def test_handle_batch_with_flock_across_rollover(handler):
+    """Tests that a locked batch is written to the file it rolled over to.
+
+    Args:
+        handler (TimedRotatingFileHandler): The handler instance under test.
+
+    Asserts:
+        - The lock is taken and released on the new log file's stream.
+        - The batch is written to the new log file without an error.
+    """
+    handler._use_flock = True
+    handler._next_rollover = 0.0
+    new_filename = handler._prefix + "2023-10-02"
+    with patch.object(handler, "get_filename", return_value=new_filename), patch(
+        "meowlogs.handlers._flock"
+    ) as mock_flock, patch.object(handler, "handleError") as mock_handle_error:
+        handler.handle_batch([copy(_TEST_RECORD), copy(_TEST_RECORD)])
+    mock_handle_error.assert_not_called()
+    assert handler.baseFilename == new_filename
+    assert [call.args[0] for call in mock_flock.call_args_list] == [
+        handler.stream,
+        handler.stream,
+    ]
+    with open(new_filename) as f:
+        assert f.read() == "Test log message\n" * 2
+
+
+def test_handle_batch_uses_filtered_record(handler):
+    """Tests that a record returned by the filters replaces the original.
+
+    Args:
+        handler (TimedRotatingFileHandler): The handler instance under test.
+
+    Asserts:
+        - The replacement record is written instead of the original.
+    """
+    replacement = copy(_TEST_RECORD)
+    replacement.msg = "Replaced message"
+    handler.addFilter(lambda record: True)
+    with patch.object(handler, "filter", return_value=replacement):
+        handler.handle_batch([copy(_TEST_RECORD)])
+    handler.flush()
+    with open(handler.baseFilename) as f:
+        assert f.read() == "Replaced message\n"
+
+
+def test_handle_async_during_close(temp_dir, mock_logging_file, mocked_time_now):
+    """Tests that a record handled while the handler is closed is not lost.
+
+    Args:
+        temp_dir (str): Path to the temporary directory.
+        mock_logging_file (MagicMock): Mocked LoggingFile class.
+        mocked_time_now (MagicMock): Mocked time.time for generating filenames.
+
+    Asserts:
+        - A record whose filters run while `close` stops the writer is
+          written to the log file instead of being queued after the stop
+          marker.
+    """
+    handler = TimedRotatingFileHandler(
+        directory=temp_dir,
+        suffix=FileHandlerDefaults.SUFFIX,
+        backup_count=FileHandlerDefaults.BACKUP_COUNT,
+        level=FileHandlerDefaults.LEVEL,
+        write_mode="async",
+    )
+
+    def close_during_filter(record):
+        handler.close()
+        return True
+
+    handler.addFilter(close_during_filter)
+    with patch.object(handler, "handleError") as mock_handle_error:
+        handler.handle(copy(_TEST_RECORD))
+    mock_handle_error.assert_not_called()
+    handler.close()
+    with open(handler.baseFilename) as f:
+        assert f.read() == "Test log message\n"
+
+
+def test_flush_async_under_continuous_logging(
+    temp_dir, mock_logging_file, mocked_time_now
+):
+    """Tests that an async `flush` does not wait for records queued after it.
+
+    Args:
+        temp_dir (str): Path to the temporary directory.
+        mock_logging_file (MagicMock): Mocked LoggingFile class.
+        mocked_time_now (MagicMock): Mocked time.time for generating filenames.
+
+    Asserts:
+        - `flush` returns while another thread keeps logging.
+        - Records emitted before `flush` are on disk when it returns.
+    """
+    handler = TimedRotatingFileHandler(
+        directory=temp_dir,
+        suffix=FileHandlerDefaults.SUFFIX,
+        backup_count=FileHandlerDefaults.BACKUP_COUNT,
+        level=FileHandlerDefaults.LEVEL,
+        write_mode="async",
+    )
+    handler.handle(copy(_TEST_RECORD))
+    stop = threading.Event()
+
+    def log_continuously():
+        while not stop.is_set():
+            handler.handle(copy(_TEST_RECORD))
+
+    logging_thread = threading.Thread(target=log_continuously)
+    logging_thread.start()
+    flushing_thread = threading.Thread(target=handler.flush)
+    flushing_thread.start()
+    flushing_thread.join(timeout=5)
+    stop.set()
+    logging_thread.join()
+    assert not flushing_thread.is_alive()
+    with open(handler.baseFilename) as f:
+        assert f.readline() == "Test log message\n"
+    handler.close()
+
+
+def test_emit_async_with_flock(temp_dir, mock_logging_file, mocked_time_now):
+    """Tests that the background writer locks the file with `use_flock`.
+
+    Args:
+        temp_dir (str): Path to the temporary directory.
+        mock_logging_file (MagicMock): Mocked LoggingFile class.
+        mocked_time_now (MagicMock): Mocked time.time for generating filenames.
+
+    Asserts:
+        - The queued records are written between a lock and an unlock.
+    """
+    handler = TimedRotatingFileHandler(
+        directory=temp_dir,
+        suffix=FileHandlerDefaults.SUFFIX,
+        backup_count=FileHandlerDefaults.BACKUP_COUNT,
+        level=FileHandlerDefaults.LEVEL,
+        use_flock=True,
+        write_mode="async",
+    )
+    with patch("meowlogs.handlers._flock") as mock_flock:
+        handler.handle(copy(_TEST_RECORD))
+        handler.flush()
+    assert [call.args[1] for call in mock_flock.call_args_list] == [
+        fcntl.LOCK_EX,
+        fcntl.LOCK_UN,
+    ]
+    with open(handler.baseFilename) as f:
+        assert f.read() == "Test log message\n"
+    handler.close()
+
+
+def test_close_releases_handler(temp_dir, mock_logging_file, mocked_time_now):
+    """Tests that a closed handler is no longer kept alive by `atexit`.
+
+    Args:
+        temp_dir (str): Path to the temporary directory.
+        mock_logging_file (MagicMock): Mocked LoggingFile class.
+        mocked_time_now (MagicMock): Mocked time.time for generating filenames.
+
+    Asserts:
+        - The handler is garbage collected once it is closed and dropped.
+    """
+    handler = TimedRotatingFileHandler(
+        directory=temp_dir,
+        suffix=FileHandlerDefaults.SUFFIX,
+        backup_count=FileHandlerDefaults.BACKUP_COUNT,
+        level=FileHandlerDefaults.LEVEL,
+    )
+    handler.close()
+    ref = weakref.ref(handler)
+    del handler
+    gc.collect()
+    assert ref() is None
+
+
+def test_async_writer_blocks_without_flush_interval(
+    temp_dir, mock_logging_file, mocked_time_now
+):
+    """Tests that a zero flush interval does not make the writer spin.
+
+    Args:
+        temp_dir (str): Path to the temporary directory.
+        mock_logging_file (MagicMock): Mocked LoggingFile class.
+        mocked_time_now (MagicMock): Mocked time.time for generating filenames.
+
+    Asserts:
+        - The idle writer waits for a record without a timeout.
+        - Records are written and flushed.
+    """
+    with patch.object(
+        queue.Queue, "get", autospec=True, side_effect=queue.Queue.get
+    ) as mock_get:
+        handler = TimedRotatingFileHandler(
+            directory=temp_dir,
+            suffix=FileHandlerDefaults.SUFFIX,
+            backup_count=FileHandlerDefaults.BACKUP_COUNT,
+            level=FileHandlerDefaults.LEVEL,
+            flush_interval=0,
+            write_mode="async",
+        )
+        handler.handle(copy(_TEST_RECORD))
+        handler.flush()
+        with open(handler.baseFilename) as f:
+            assert f.read() == "Test log message\n"
+        handler.close()
+    timeouts = [
+        call.kwargs["timeout"]
+        for call in mock_get.call_args_list
+        if "timeout" in call.kwargs
+    ]
+    assert timeouts and all(timeout is None for timeout in timeouts)
+
+
+def test_emit_with_delay(temp_dir, mock_logging_file, mocked_time_now):
+    """Tests that a handler created with `delay` opens its file on first use.
+
+    Args:
+        temp_dir (str): Path to the temporary directory.
+        mock_logging_file (MagicMock): Mocked LoggingFile class.
+        mocked_time_now (MagicMock): Mocked time.time for generating filenames.
+
+    Asserts:
+        - No stream is opened before the first record.
+        - The first record is written to the log file.
+    """
+    handler = TimedRotatingFileHandler(
+        directory=temp_dir,
+        suffix=FileHandlerDefaults.SUFFIX,
+        backup_count=FileHandlerDefaults.BACKUP_COUNT,
+        level=FileHandlerDefaults.LEVEL,
+        delay=True,
+    )
+    assert handler.stream is None
+    with patch.object(handler, "handleError") as mock_handle_error:
+        handler.handle(copy(_TEST_RECORD))
+    mock_handle_error.assert_not_called()
+    handler.close()
+    with open(handler.baseFilename) as f:
+        assert f.read() == "Test log message\n"